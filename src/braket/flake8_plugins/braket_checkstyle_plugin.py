@@ -12,10 +12,8 @@
 # language governing permissions and limitations under the License.
 
 import ast
-import re
-from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Generator, Optional, Set, Tuple, Type
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import braket._build_tools._version as build_tools_version
 
@@ -33,75 +31,114 @@ class ArgType(str, Enum):
     KEYWORD = "KEYWORD"
 
 
-@dataclass
+class DocLine(str, Enum):
+    BLANK = "BLANK"
+    TEXT = "TEXT"
+    ARGS_HEADER = "ARGS_HEADER"
+    RETURN_HEADER = "RETURN_HEADER"
+    MISC_HEADER = "MISC_HEADER"
+
+
 class DocContext:
     """
     This is the context object for parsing the function definition. We record all the information
     we need about the function and the current state of parsing.
     """
 
-    found_args: bool = False
-    found_return: bool = False
-    found_description: bool = False
-    in_sub_list: bool = False
-    current_section: DocSection = DocSection.DESCRIPTION
-    previous_arg: Tuple[int, ArgType] = None
-    found_arg_list: Set = None
-    args_indent: int = 0
-    return_indent: int = 0
-    invalid_indents: int = 0
-    first_invalid_indent_line: str = None
-
-
-class _Visitor(ast.NodeVisitor):
-    ARGS_REGEX = re.compile(r"^(\s*)Args\s*:\s*$")
-    RETURN_REGEX = re.compile(r"^(\s*)(Returns|Yields)\s*:\s*$")
-    MISC_REGEX = re.compile(
-        r"^(\s*)(Throws|Raises|See Also|Note|Example|Examples|Warnings)( \(.+\))?:\s*$"
+    __slots__ = (
+        "found_args",
+        "found_return",
+        "found_description",
+        "in_sub_list",
+        "current_section",
+        "previous_arg",
+        "found_arg_list",
+        "args_indent",
+        "args_body_indent",
+        "return_indent",
+        "invalid_indents",
+        "first_invalid_indent_line",
+        "arg_indices",
+        "documentable_args",
+        "has_reserved_first_arg",
+        "requires_documentation",
+    )
+
+    def __init__(
+        self,
+        arg_indices: Dict[str, Tuple[int, ArgType]] = None,
+        documentable_args: List[Tuple[int, ast.arg]] = None,
+        has_reserved_first_arg: bool = False,
+        requires_documentation: bool = False,
+    ) -> None:
+        self.found_args: bool = False
+        self.found_return: bool = False
+        self.found_description: bool = False
+        self.in_sub_list: bool = False
+        self.current_section: DocSection = DocSection.DESCRIPTION
+        self.previous_arg: Tuple[int, ArgType] = None
+        self.found_arg_list: Set[Tuple[int, ArgType]] = set()
+        self.args_indent: int = 0
+        self.args_body_indent: int = 0
+        self.return_indent: int = 0
+        self.invalid_indents: int = 0
+        self.first_invalid_indent_line: str = None
+        self.arg_indices: Dict[str, Tuple[int, ArgType]] = arg_indices or {}
+        self.documentable_args: List[Tuple[int, ast.arg]] = documentable_args or []
+        self.has_reserved_first_arg: bool = has_reserved_first_arg
+        self.requires_documentation: bool = requires_documentation
+
+
+SECTION_HEADERS = {
+    "Args": DocLine.ARGS_HEADER,
+    "Returns": DocLine.RETURN_HEADER,
+    "Yields": DocLine.RETURN_HEADER,
+}
+MISC_HEADERS = frozenset(
+    {"Throws", "Raises", "See Also", "Note", "Example", "Examples", "Warnings"}
+)
+
+
+class _Visitor:
+    RESERVED_ARGS = frozenset({"self", "cls"})
+
+    # Indexed by the numeric part of the error code minus one.
+    MESSAGES = (
+        "Argument '%s' is missing a type hint.",  # BCS001
+        "Function '%s' is missing a type hint for the return value.",  # BCS002
+        "Function '%s' is missing documentation.",  # BCS003
+        "Argument '%s' documentation is missing the type hint.",  # BCS004
+        "Argument '%s' type hint doesn't match documentation. expected: '%s', documented as: '%s'.",  # BCS005  # noqa
+        "Function '%s' doesn't specify a return type in the documentation. expected: '%s'.",  # BCS006  # noqa
+        "Unknown documented argument '%s'.",  # BCS007
+        "Argument '%s' is missing a description.",  # BCS008
+        "Argument '%s' is specified more than once.",  # BCS009
+        "Function '%s' return type hint doesn't match documentation. expected: '%s', documented as: '%s'.",  # BCS010  # noqa
+        "Argument '%s' is missing type hint documentation.",  # BCS011
+        "Function '%s' argument and return documentation has duplicate argument definitions.",  # BCS012  # noqa
+        "Function '%s' has documented sections in the wrong order",  # BCS013
+        "Function '%s' argument and return documentation has duplicate return definitions.",  # BCS014  # noqa
+        "Argument '%s' is out of order.",  # BCS015
+        "Return doc for function '%s' is missing the description.",  # BCS016
+        "Function '%s' is missing function description documentation.",  # BCS017
+        "Function '%s' is missing argument documentation.",  # BCS018
+        "Function '%s' has argument documentation but no arguments.",  # BCS019
+        "Function '%s' has return documentation but no return type.",  # BCS020
+        "Function '%s' is missing return documentation.",  # BCS021
+        "Found '%d' invalid indents starting with line ('%s').",  # BCS022
+        "Argument '%s' defaults to None but type hint doesn't end with '| None'.",  # BCS023
     )
-    ARG_INFO_REGEX = re.compile(r"^(\s*)`{0,2}(\*{0,2}\w*)`{0,2}\s*(\([^:]*\))?\s*:\s*(.*)")
-    RETURN_INFO_REGEX = re.compile(r"^(\s*)([^:]*)\s*(:)?\s*(.*)")
-    INDENT_REGEX = re.compile(r"^(\s*)(\S+.*)")
-    RESERVED_ARGS = {"self", "cls"}
-
-    MESSAGES = {
-        "BCS001": "Argument '%s' is missing a type hint.",
-        "BCS002": "Function '%s' is missing a type hint for the return value.",
-        "BCS003": "Function '%s' is missing documentation.",
-        "BCS004": "Argument '%s' documentation is missing the type hint.",
-        "BCS005": "Argument '%s' type hint doesn't match documentation. expected: '%s', documented as: '%s'.",  # noqa
-        "BCS006": "Function '%s' doesn't specify a return type in the documentation. expected: '%s'.",  # noqa
-        "BCS007": "Unknown documented argument '%s'.",
-        "BCS008": "Argument '%s' is missing a description.",
-        "BCS009": "Argument '%s' is specified more than once.",
-        "BCS010": "Function '%s' return type hint doesn't match documentation. expected: '%s', documented as: '%s'.",  # noqa
-        "BCS011": "Argument '%s' is missing type hint documentation.",
-        "BCS012": "Function '%s' argument and return documentation has duplicate argument definitions.",
-        "BCS013": "Function '%s' has documented sections in the wrong order",
-        "BCS014": "Function '%s' argument and return documentation has duplicate return definitions.",
-        "BCS015": "Argument '%s' is out of order.",
-        "BCS016": "Return doc for function '%s' is missing the description.",
-        "BCS017": "Function '%s' is missing function description documentation.",
-        "BCS018": "Function '%s' is missing argument documentation.",
-        "BCS019": "Function '%s' has argument documentation but no arguments.",
-        "BCS020": "Function '%s' has return documentation but no return type.",
-        "BCS021": "Function '%s' is missing return documentation.",
-        "BCS022": "Found '%d' invalid indents starting with line ('%s').",
-        "BCS023": "Argument '%s' defaults to None but type hint doesn't end with '| None'.",
-    }
 
     def __init__(self) -> None:
         self.problems = []
 
-    def add_problem(self, node: ast.AST, code: str, arguments: Any):
-        message = self.MESSAGES[code] % arguments
-        self.problems.append([node.lineno, node.col_offset, f"{code} - {message}"])
+    def add_problem(self, node: ast.AST, code: int, arguments: Any):
+        self.problems.append((node.lineno, node.col_offset, code, arguments))
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> Any:
+    def check_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
         self._check_arguments(node.name, node.args)
         self._check_return(node)
         self._check_documentation(node)
-        self.generic_visit(node)
 
     def _check_arguments(self, name: str, args: ast.arguments) -> None:
         if name.startswith("__") or name == "_":
@@ -109,98 +146,101 @@ class _Visitor(ast.NodeVisitor):
         for argument in args.args:
             if argument.annotation is None:
                 if argument.arg not in self.RESERVED_ARGS:
-                    self.add_problem(node=argument, code="BCS001", arguments=argument.arg)
+                    self.add_problem(node=argument, code=1, arguments=argument.arg)
         for argument in args.kwonlyargs:
             if argument.annotation is None:
-                self.add_problem(node=argument, code="BCS001", arguments=argument.arg)
+                self.add_problem(node=argument, code=1, arguments=argument.arg)
 
     def _check_return(self, node: ast.FunctionDef) -> None:
         if not node.returns and not node.name.startswith("__") and node.name != "_":
-            self.add_problem(node=node, code="BCS002", arguments=node.name)
+            self.add_problem(node=node, code=2, arguments=node.name)
 
     def _check_documentation(self, node: ast.FunctionDef) -> None:
+        requires_documentation = _function_requires_documentation(node)
         doc = _get_first_doc(node)
         if doc is None:
-            if _function_requires_documentation(node):
-                self.add_problem(node=node, code="BCS003", arguments=node.name)
+            if requires_documentation:
+                self.add_problem(node=node, code=3, arguments=node.name)
             return
-        doc_lines = doc.s.split("\n")
-        context = DocContext()
-        for doc_line in doc_lines:
-            self._check_doc_line(doc_line, context, node)
+        args = node.args.args
+        context = DocContext(
+            arg_indices=_get_argument_indices(node),
+            documentable_args=self._get_documentable_args(node),
+            has_reserved_first_arg=bool(args) and args[0].arg in self.RESERVED_ARGS,
+            requires_documentation=requires_documentation,
+        )
+        for kind, doc_line, indent in _tokenize_doc(doc.value.split("\n")):
+            self._check_doc_line(kind, doc_line, indent, context, node)
         self._verify_context(context, node)
 
-    def _check_doc_line(self, doc_line: str, context: DocContext, node: ast.FunctionDef) -> None:
-        if self._check_doc_args(doc_line, context, node):
-            return
-        if self._check_doc_return(doc_line, context, node):
-            return
-        if self._check_doc_misc(doc_line, context, node):
-            return
-        self._check_doc_section(doc_line, context, node)
-
-    def _verify_context(self, context: DocContext, node: ast.FunctionDef) -> None:
-        self._verify_description(context, node)
-        self._verify_args(context, node)
-        self._verify_return(context, node)
-        self._verify_indents(context, node)
-
-    def _check_doc_args(self, doc_line: str, context: DocContext, node: ast.FunctionDef) -> bool:
-        match = self.ARGS_REGEX.match(doc_line)
-        if match:
+    def _check_doc_line(
+        self,
+        kind: DocLine,
+        doc_line: str,
+        indent: int,
+        context: DocContext,
+        node: ast.FunctionDef,
+    ) -> None:
+        if kind is DocLine.TEXT:
+            self._check_doc_section(doc_line, context, node)
+        elif kind is DocLine.BLANK:
+            if context.current_section == DocSection.RETURN_FIRST_LINE:
+                self._check_doc_section(doc_line, context, node)
+        elif kind is DocLine.ARGS_HEADER:
             if context.found_args:
-                self.add_problem(node=node, code="BCS012", arguments=node.name)
-                return False
+                self.add_problem(node=node, code=12, arguments=node.name)
+                self._check_doc_section(doc_line, context, node)
+                return
             if context.found_return:
-                self.add_problem(node=node, code="BCS013", arguments=node.name)
+                self.add_problem(node=node, code=13, arguments=node.name)
             context.found_args = True
-            context.args_indent = 4 if match.groups()[0] is None else len(match.groups()[0]) + 4
+            context.args_indent = indent + 4
+            context.args_body_indent = indent + 8
             context.current_section = DocSection.ARGUMENTS
-            return True
-        return False
-
-    def _check_doc_return(self, doc_line: str, context: DocContext, node: ast.FunctionDef) -> bool:
-        match = self.RETURN_REGEX.match(doc_line)
-        if match:
+        elif kind is DocLine.RETURN_HEADER:
             if context.found_return:
-                self.add_problem(node=node, code="BCS014", arguments=node.name)
-                return False
+                self.add_problem(node=node, code=14, arguments=node.name)
+                self._check_doc_section(doc_line, context, node)
+                return
             context.found_return = True
-            context.return_indent = 4 if match.groups()[0] is None else len(match.groups()[0]) + 4
+            context.return_indent = indent + 4
             context.current_section = DocSection.RETURN_FIRST_LINE
-            return True
-        return False
-
-    def _check_doc_misc(self, doc_line: str, context: DocContext, _: ast.FunctionDef) -> bool:
-        if self.MISC_REGEX.match(doc_line):
+        else:
             context.current_section = DocSection.MISC
-            return True
-        return False
+
+    def _verify_context(self, context: DocContext, node: ast.FunctionDef) -> None:
+        self._verify_description(context, node)
+        self._verify_args(context, node)
+        self._verify_return(context, node)
+        self._verify_indents(context, node)
 
     def _check_doc_section(self, doc_line: str, context: DocContext, node: ast.FunctionDef) -> None:
         if context.current_section == DocSection.DESCRIPTION:
             if len(doc_line.strip()) > 1:
                 context.found_description = True
         elif context.current_section == DocSection.ARGUMENTS:
-            matches = self.ARG_INFO_REGEX.match(doc_line)
-            if matches:
+            # Continuation lines rarely contain a colon, so only those that do need parsing.
+            arg_info = _parse_arg_info(doc_line) if ":" in doc_line else None
+            if arg_info:
                 context.in_sub_list = False
-                self._check_argument_info(matches, context, node)
+                self._check_argument_info(arg_info, context, node)
             else:
-                self._check_indent(context.args_indent + 4, doc_line, context)
+                self._check_indent(context.args_body_indent, doc_line, context)
         elif context.current_section == DocSection.RETURN_FIRST_LINE:
-            matches = self.RETURN_INFO_REGEX.match(doc_line)
-            self._check_return_info(matches, context, node)
+            self._check_return_info(_parse_return_info(doc_line), context, node)
             context.in_sub_list = False
             context.current_section = DocSection.RETURN_REST
         elif context.current_section == DocSection.RETURN_REST:
             self._check_indent(context.return_indent, doc_line, context)
 
     def _check_argument_info(
-        self, regex_matches: re.Match, context: DocContext, node: ast.FunctionDef
+        self,
+        arg_info: Tuple[str, str, Optional[str], str],
+        context: DocContext,
+        node: ast.FunctionDef,
     ) -> None:
-        arg_indent, arg_name, arg_hint, arg_description = regex_matches.groups()
-        arg_index, arg_type = _get_argument_with_name(arg_name, node)
+        arg_indent, arg_name, arg_hint, arg_description = arg_info
+        arg_index, arg_type = context.arg_indices.get(arg_name, (None, None))
         self._check_argument_indent(arg_indent, arg_name, arg_index, context, node)
         if arg_index is None:
             return
@@ -219,9 +259,11 @@ class _Visitor(ast.NodeVisitor):
     ) -> None:
         if len(arg_indent) == context.args_indent:
             if arg_index is None and arg_name and not arg_name.startswith("*"):
-                self.add_problem(node=node, code="BCS007", arguments=arg_name)
-        elif len(arg_indent) != context.args_indent + 4:
-            _invalid_indent_found(arg_name, context)
+                self.add_problem(node=node, code=7, arguments=arg_name)
+        elif len(arg_indent) != context.args_body_indent:
+            if context.invalid_indents == 0:
+                _record_first_invalid_indent(arg_name, context)
+            context.invalid_indents += 1
 
     def _check_argument_docs(
         self,
@@ -233,25 +275,22 @@ class _Visitor(ast.NodeVisitor):
         context: DocContext,
         node: ast.FunctionDef,
     ) -> None:
-        if context.found_arg_list is None:
-            context.found_arg_list = {(arg_index, arg_type)}
-        elif (arg_index, arg_type) in context.found_arg_list:
-            self.add_problem(node=node, code="BCS009", arguments=arg_name)
+        if (arg_index, arg_type) in context.found_arg_list:
+            self.add_problem(node=node, code=9, arguments=arg_name)
             return
-        else:
-            context.found_arg_list.add((arg_index, arg_type))
+        context.found_arg_list.add((arg_index, arg_type))
 
         self._check_argument_order(arg_name, arg_index, arg_type, context, node)
 
         if arg_hint is None:
-            self.add_problem(node=node, code="BCS004", arguments=arg_name)
+            self.add_problem(node=node, code=4, arguments=arg_name)
         else:
             self._check_annotation(arg_name, arg_hint, arg_index, arg_type, node)
 
         if (arg_description is None or len(arg_description.strip()) < 2) and (
             len(arg_name) + len(arg_hint) < 70
         ):
-            self.add_problem(node=node, code="BCS008", arguments=arg_name)
+            self.add_problem(node=node, code=8, arguments=arg_name)
 
     def _check_argument_order(
         self,
@@ -263,14 +302,14 @@ class _Visitor(ast.NodeVisitor):
     ) -> None:
         expected_index = 0
         if context.previous_arg is None:
-            if node.args.args and node.args.args[0].arg in self.RESERVED_ARGS:
+            if context.has_reserved_first_arg:
                 expected_index = 1
         elif arg_type == context.previous_arg[1]:
             expected_index = context.previous_arg[0] + 1
         if arg_index != expected_index:
-            self.add_problem(node=node, code="BCS015", arguments=arg_name)
+            self.add_problem(node=node, code=15, arguments=arg_name)
 
-    def _check_annotation(
+    def _check_annotation(  # noqa: C901
         self,
         arg_name: str,
         arg_hint: str,
@@ -295,11 +334,11 @@ class _Visitor(ast.NodeVisitor):
                 default_value = node.args.kw_defaults[default_index]
         documented_type = _remove_all_spaces(arg_hint[1:-1])
         if annotation:
-            annotation_doc = _remove_all_spaces(self._annotation_to_doc_str(annotation))
+            annotation_doc = self._annotation_to_doc_str(annotation)
             if not _are_type_strings_same(annotation_doc, documented_type):
                 self.add_problem(
                     node=node,
-                    code="BCS005",
+                    code=5,
                     arguments=(arg_name, annotation_doc, documented_type),
                 )
         if (
@@ -314,140 +353,156 @@ class _Visitor(ast.NodeVisitor):
             ):
                 self.add_problem(
                     node=node,
-                    code="BCS023",
+                    code=23,
                     arguments=(arg_name),
                 )
 
-    # flake8: noqa: C901
     def _annotation_to_doc_str(self, annotation) -> str:
-        if isinstance(annotation, ast.Name):
-            return annotation.id
-        if isinstance(annotation, ast.Attribute):
-            return annotation.attr
-        if isinstance(annotation, ast.Constant) and annotation.value is None:
+        # The result is built from identifiers only, so it never contains whitespace.
+        handler = self.ANNOTATION_HANDLERS.get(type(annotation))
+        return handler(self, annotation) if handler else ""
+
+    def _name_to_doc_str(self, annotation: ast.Name) -> str:
+        return annotation.id
+
+    def _attribute_to_doc_str(self, annotation: ast.Attribute) -> str:
+        return annotation.attr
+
+    def _constant_to_doc_str(self, annotation: ast.Constant) -> str:
+        if annotation.value is None:
             return "None"
-        if isinstance(annotation, ast.Subscript):
-            if isinstance(annotation.value, ast.Name):
-                if isinstance(annotation.slice, ast.Index):
-                    slice_name = self._annotation_to_doc_str(annotation.slice.value)
-                else:
-                    # This is done to be backward compatible.
-                    slice_name = self._annotation_to_doc_str(annotation.slice)
-                return annotation.value.id + f"[{slice_name}]"
-            raise NotImplementedError("Currently not handling annotation values that are not Names")
-        elif isinstance(annotation, (ast.List, ast.Tuple)):
-            values = []
-            for elt in annotation.elts:
-                if isinstance(elt, ast.Name):
-                    values.append(elt.id)
-                else:
-                    values.append(self._annotation_to_doc_str(elt))
-            result = ",".join(values)
-            if isinstance(annotation, ast.List):
-                return f"[{result}]"
-            return result
-        elif isinstance(annotation, ast.Ellipsis):
+        if annotation.value is Ellipsis:
             return "..."
-        elif isinstance(annotation, ast.BinOp):
-            if isinstance(annotation.op, ast.BitOr):
-                return f"{self._annotation_to_doc_str(annotation.left)}|{self._annotation_to_doc_str(annotation.right)}"
-            if isinstance(annotation.op, ast.BitAnd):
-                return f"{self._annotation_to_doc_str(annotation.left)}&{self._annotation_to_doc_str(annotation.right)}"
-            raise NotImplementedError("Currently not handling annotation XOR binary operations")
         return ""
 
+    def _subscript_to_doc_str(self, annotation: ast.Subscript) -> str:
+        if isinstance(annotation.value, ast.Name):
+            if isinstance(annotation.slice, ast.Index):
+                slice_name = self._annotation_to_doc_str(annotation.slice.value)
+            else:
+                # This is done to be backward compatible.
+                slice_name = self._annotation_to_doc_str(annotation.slice)
+            return annotation.value.id + f"[{slice_name}]"
+        raise NotImplementedError("Currently not handling annotation values that are not Names")
+
+    def _sequence_to_doc_str(self, annotation: Union[ast.List, ast.Tuple]) -> str:
+        values = []
+        for elt in annotation.elts:
+            if isinstance(elt, ast.Name):
+                values.append(elt.id)
+            else:
+                values.append(self._annotation_to_doc_str(elt))
+        result = ",".join(values)
+        if isinstance(annotation, ast.List):
+            return f"[{result}]"
+        return result
+
+    def _binop_to_doc_str(self, annotation: ast.BinOp) -> str:
+        if isinstance(annotation.op, ast.BitOr):
+            return f"{self._annotation_to_doc_str(annotation.left)}|{self._annotation_to_doc_str(annotation.right)}"  # noqa
+        if isinstance(annotation.op, ast.BitAnd):
+            return f"{self._annotation_to_doc_str(annotation.left)}&{self._annotation_to_doc_str(annotation.right)}"  # noqa
+        raise NotImplementedError("Currently not handling annotation XOR binary operations")
+
+    ANNOTATION_HANDLERS = {
+        ast.Name: _name_to_doc_str,
+        ast.Attribute: _attribute_to_doc_str,
+        ast.Constant: _constant_to_doc_str,
+        ast.Subscript: _subscript_to_doc_str,
+        ast.List: _sequence_to_doc_str,
+        ast.Tuple: _sequence_to_doc_str,
+        ast.BinOp: _binop_to_doc_str,
+    }
+
     def _check_return_info(
-        self, regex_matches: re.Match, context: DocContext, node: ast.FunctionDef
+        self,
+        return_info: Tuple[str, str, Optional[str], str],
+        context: DocContext,
+        node: ast.FunctionDef,
     ) -> None:
-        return_indent, documented_type, colon, return_description = regex_matches.groups()
+        return_indent, documented_type, colon, return_description = return_info
         if return_indent is not None and len(return_indent) != context.return_indent:
-            _invalid_indent_found(documented_type, context)
+            if context.invalid_indents == 0:
+                _record_first_invalid_indent(documented_type, context)
+            context.invalid_indents += 1
         if colon is None:
             return_description = documented_type
             documented_type = None
         has_documentation = return_description is not None and len(return_description.strip()) > 1
         if node.returns and not has_documentation:
-            self.add_problem(node=node, code="BCS016", arguments=node.name)
+            self.add_problem(node=node, code=16, arguments=node.name)
         if node.returns:
-            return_doc = _remove_all_spaces(self._annotation_to_doc_str(node.returns))
+            return_doc = self._annotation_to_doc_str(node.returns)
             if documented_type is None:
-                self.add_problem(node=node, code="BCS006", arguments=(node.name, return_doc))
+                self.add_problem(node=node, code=6, arguments=(node.name, return_doc))
             else:
                 documented_type = _remove_all_spaces(documented_type)
                 if not _are_type_strings_same(return_doc, documented_type):
                     self.add_problem(
                         node=node,
-                        code="BCS010",
+                        code=10,
                         arguments=(node.name, return_doc, documented_type),
                     )
 
     def _verify_description(self, context: DocContext, node: ast.FunctionDef) -> None:
-        if not context.found_description and _function_requires_documentation(node):
-            self.add_problem(node=node, code="BCS017", arguments=node.name)
+        if context.requires_documentation and not context.found_description:
+            self.add_problem(node=node, code=17, arguments=node.name)
 
     def _verify_args(self, context: DocContext, node: ast.FunctionDef) -> None:
+        args = node.args
         if not context.found_args:
-            if self._function_has_arguments_to_document(node) and _function_requires_documentation(
-                node
-            ):
-                self.add_problem(node=node, code="BCS018", arguments=node.name)
+            if context.requires_documentation and context.documentable_args:
+                self.add_problem(node=node, code=18, arguments=node.name)
             return
         if (
-            not self._function_has_arguments_to_document(node)
-            and node.args.kwarg is None
-            and node.args.vararg is None
-            and (node.args.kwonlyargs is None or node.args.kwonlyargs == [])
-            and (node.args.posonlyargs is None or node.args.posonlyargs == [])
+            not context.documentable_args
+            and args.kwarg is None
+            and args.vararg is None
+            and not args.kwonlyargs
+            and not args.posonlyargs
         ):
-            self.add_problem(node=node, code="BCS019", arguments=node.name)
+            self.add_problem(node=node, code=19, arguments=node.name)
             return
         if context.found_arg_list:
-            for index, arg in enumerate(node.args.args):
-                if (
-                    index,
-                    ArgType.DEFAULT,
-                ) not in context.found_arg_list and arg.arg not in self.RESERVED_ARGS:
-                    self.add_problem(node=node, code="BCS011", arguments=arg.arg)
-            for index, arg in enumerate(node.args.kwonlyargs):
+            for index, arg in context.documentable_args:
+                if (index, ArgType.DEFAULT) not in context.found_arg_list:
+                    self.add_problem(node=node, code=11, arguments=arg.arg)
+            for index, arg in enumerate(args.kwonlyargs):
                 if (index, ArgType.KEYWORD) not in context.found_arg_list:
-                    self.add_problem(node=node, code="BCS011", arguments=arg.arg)
+                    self.add_problem(node=node, code=11, arguments=arg.arg)
 
     def _verify_return(self, context: DocContext, node: ast.FunctionDef) -> None:
         if context.found_return:
             if not node.returns:
-                self.add_problem(node=node, code="BCS020", arguments=node.name)
-        else:
-            if _function_requires_documentation(node) and _return_type_requires_documentation(node):
-                self.add_problem(node=node, code="BCS021", arguments=node.name)
+                self.add_problem(node=node, code=20, arguments=node.name)
+        elif context.requires_documentation and _return_type_requires_documentation(node):
+            self.add_problem(node=node, code=21, arguments=node.name)
 
     def _verify_indents(self, context: DocContext, node: ast.FunctionDef) -> None:
         if context.invalid_indents > 0:
             self.add_problem(
                 node=node,
-                code="BCS022",
+                code=22,
                 arguments=(context.invalid_indents, context.first_invalid_indent_line),
             )
 
-    def _function_has_arguments_to_document(self, node: ast.FunctionDef) -> bool:
-        if not node.args or not node.args.args:
-            return False
-        for args in node.args.args:
-            if args.arg not in self.RESERVED_ARGS:
-                return True
-        return False
+    def _get_documentable_args(self, node: ast.FunctionDef) -> List[Tuple[int, ast.arg]]:
+        return [
+            (index, arg)
+            for index, arg in enumerate(node.args.args)
+            if arg.arg not in self.RESERVED_ARGS
+        ]
 
     def _check_indent(self, expected_indent: int, line: str, context: DocContext) -> None:
-        match = self.INDENT_REGEX.match(line)
-        if match:
-            groups = match.groups()
-            indent = groups[0]
-            text = groups[1]
-            ind_len = len(indent)
-            if indent is not None and ind_len != expected_indent:
-                if text.startswith("-") and ind_len in [expected_indent - 2, expected_indent + 2]:
-                    context.in_sub_list = True
-                elif not context.in_sub_list:
-                    _invalid_indent_found(line, context)
+        text = line.lstrip()
+        ind_len = len(line) - len(text)
+        if ind_len != expected_indent:
+            if text.startswith("-") and ind_len in (expected_indent - 2, expected_indent + 2):
+                context.in_sub_list = True
+            elif not context.in_sub_list:
+                if context.invalid_indents == 0:
+                    _record_first_invalid_indent(line, context)
+                context.invalid_indents += 1
 
 
 class BraketCheckstylePlugin:
@@ -460,35 +515,115 @@ class BraketCheckstylePlugin:
 
     def run(self) -> Generator[Tuple[int, int, str, Type[Any]], None, None]:
         visitor = _Visitor()
-        visitor.visit(self._tree)
-        for line, col, msg in visitor.problems:
-            yield line, col, msg, type(self)
+        nodes = [self._tree]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                visitor.check_function(node)
+            nodes.extend(ast.iter_child_nodes(node))
+        for line, col, code, arguments in visitor.problems:
+            message = visitor.MESSAGES[code - 1] % arguments
+            yield line, col, f"BCS{code:03d} - {message}", type(self)
+
+
+def _tokenize_doc(doc_lines: Iterable[str]) -> Generator[Tuple[DocLine, str, int], None, None]:
+    in_misc_section = False
+    for doc_line in doc_lines:
+        header = _parse_section_header(doc_line)
+        if header is None:
+            # Nothing inside a Raises, Example, etc. section is checked until the next header.
+            if not in_misc_section:
+                kind = DocLine.TEXT if doc_line and not doc_line.isspace() else DocLine.BLANK
+                yield kind, doc_line, 0
+            continue
+        kind, indent = header
+        in_misc_section = kind is DocLine.MISC_HEADER
+        yield kind, doc_line, indent
+
+
+def _parse_section_header(doc_line: str) -> Optional[Tuple[DocLine, int]]:
+    # Headers are "Args:", "Returns:" or "Yields:" with optional spaces before the colon, or a
+    # misc keyword directly followed by the colon or by " (<anything>):".
+    stripped = doc_line.rstrip()
+    if stripped[-1:] != ":":
+        return None
+    header = stripped[:-1]
+    keyword = header.lstrip()
+    indent = len(header) - len(keyword)
+    kind = SECTION_HEADERS.get(keyword.rstrip())
+    if kind is not None:
+        return kind, indent
+    if keyword in MISC_HEADERS:
+        return DocLine.MISC_HEADER, indent
+    keyword, separator, condition = keyword.partition(" (")
+    if separator and keyword in MISC_HEADERS and len(condition) > 1 and condition[-1] == ")":
+        return DocLine.MISC_HEADER, indent
+    return None
 
 
-def _get_first_doc(node: ast.FunctionDef):
-    for body_node in node.body:
-        if isinstance(body_node, ast.Expr) and isinstance(body_node.value, ast.Str):
-            return body_node.value
+def _get_first_doc(node: ast.FunctionDef) -> Optional[ast.Constant]:
+    first_node = node.body[0]
+    if (
+        isinstance(first_node, ast.Expr)
+        and isinstance(first_node.value, ast.Constant)
+        and isinstance(first_node.value.value, str)
+    ):
+        return first_node.value
     return None
 
 
-def _get_argument_with_name(
-    arg_name: str, node: ast.FunctionDef
-) -> Tuple[Optional[int], Optional[ArgType]]:
-    for index, arg in enumerate(node.args.args):
-        if arg_name == arg.arg:
-            return index, ArgType.DEFAULT
+def _get_argument_indices(node: ast.FunctionDef) -> Dict[str, Tuple[int, ArgType]]:
+    arg_indices = {arg.arg: (index, ArgType.DEFAULT) for index, arg in enumerate(node.args.args)}
     for index, arg in enumerate(node.args.kwonlyargs):
-        if arg_name == arg.arg:
-            return index, ArgType.KEYWORD
-    return None, None
+        arg_indices.setdefault(arg.arg, (index, ArgType.KEYWORD))
+    return arg_indices
+
+
+def _parse_arg_info(line: str) -> Optional[Tuple[str, str, Optional[str], str]]:
+    # Equivalent to matching r"^(\s*)`{0,2}(\*{0,2}\w*)`{0,2}\s*(\([^:]*\))?\s*:\s*(.*)" and
+    # returning its groups, without the regex backtracking on long lines.
+    colon = line.find(":")
+    if colon == -1:
+        return None
+    header = line[:colon]
+    name_part = header.lstrip()
+    indent = header[: len(header) - len(name_part)]
+    ticks = len(name_part) - len(name_part.lstrip("`"))
+    if ticks > 2:
+        name_start = name_end = 2
+        index = min(ticks, 4)
+    else:
+        name_start = index = ticks
+        if name_part.startswith("**", index):
+            index += 2
+        elif name_part.startswith("*", index):
+            index += 1
+        while index < len(name_part) and (name_part[index].isalnum() or name_part[index] == "_"):
+            index += 1
+        name_end = index
+        if name_part.startswith("``", index):
+            index += 2
+        elif name_part.startswith("`", index):
+            index += 1
+    arg_hint = name_part[index:].strip()
+    if arg_hint and (arg_hint[0] != "(" or arg_hint[-1] != ")"):
+        return None
+    return indent, name_part[name_start:name_end], arg_hint or None, line[colon + 1 :].lstrip()
+
+
+def _parse_return_info(line: str) -> Tuple[str, str, Optional[str], str]:
+    # Equivalent to the groups of r"^(\s*)([^:]*)\s*(:)?\s*(.*)", which always matches.
+    documented_type, colon, return_description = line.partition(":")
+    type_part = documented_type.lstrip()
+    indent = documented_type[: len(documented_type) - len(type_part)]
+    return indent, type_part, colon or None, return_description.lstrip()
 
 
 def _function_requires_documentation(node: ast.FunctionDef) -> bool:
     if node.name.startswith("_") or node.body is None or len(node.body) == 0:
         return False
     for body_node in node.body:
-        if not isinstance(body_node, (ast.Expr, ast.Return, ast.Raise)):
+        if not isinstance(body_node, (ast.Expr, ast.Pass, ast.Return, ast.Raise)):
             return True
     return False
 
@@ -501,23 +636,19 @@ def _return_type_requires_documentation(node: ast.FunctionDef) -> bool:
     return True
 
 
-def _invalid_indent_found(line: str, context: DocContext) -> None:
-    if context.invalid_indents == 0:
-        line = line.strip()
-        if len(line) > 18:
-            line = line[:15] + "..."
-        context.first_invalid_indent_line = line
-    context.invalid_indents = context.invalid_indents + 1
+def _record_first_invalid_indent(line: str, context: DocContext) -> None:
+    line = line.strip()
+    if len(line) > 18:
+        line = line[:15] + "..."
+    context.first_invalid_indent_line = line
 
 
 def _remove_all_spaces(string: str) -> str:
-    return re.sub(r"\s+", "", string)
+    return "".join(string.split())
 
 
 def _are_type_strings_same(annotated_type: str, documented_type: str) -> bool:
     if annotated_type == documented_type:
         return True
-    param_split = documented_type.split(".")
-    if len(param_split) > 1:
-        return annotated_type == param_split[-1]
-    return False
+    last_dot = documented_type.rfind(".")
+    return last_dot != -1 and annotated_type == documented_type[last_dot + 1 :]
@@ -0,0 +1,38 @@
+# Runtime budget for the plugin, kept out of the unit tests; run with `pytest test/perf`.
+
+import ast
+import os
+from typing import List
+
+from braket.flake8_plugins.braket_checkstyle_plugin import BraketCheckstylePlugin
+
+EXAMPLE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "unit_tests", "braket", "flake8_plugins", "example_files"
+)
+
+# Generous ceiling for one pass over every example file; a typical run takes a few milliseconds.
+RUNTIME_BUDGET_SECONDS = 0.05
+
+
+def _read_trees() -> List[ast.AST]:
+    trees = []
+    for filename in sorted(os.listdir(EXAMPLE_DIR)):
+        if filename.endswith(".py"):
+            with open(os.path.join(EXAMPLE_DIR, filename)) as file:
+                trees.append(ast.parse(file.read()))
+    return trees
+
+
+def _run_all(trees: List[ast.AST]) -> None:
+    for tree in trees:
+        list(BraketCheckstylePlugin(tree).run())
+
+
+def test_plugin_runtime(benchmark) -> None:
+    """Time the plugin over every example file and check it stays within budget.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+    """
+    benchmark(_run_all, _read_trees())
+    if benchmark.stats:
+        assert benchmark.stats.stats.mean < RUNTIME_BUDGET_SECONDS
@@ -0,0 +1,20 @@
+async def function_0(a0, a1: int) -> int:
+    """This is a description.
+    Args:
+        a0 (int): This is a parameter
+        a1 (str): This is a parameter
+    Returns:
+        int: value of the function
+    """
+    value = await a1
+    return value
+
+
+class MyClass:
+    async def function_1(self, a0: int):
+        """This is a description.
+        Args:
+            a0 (int): This is a parameter
+        """
+        value = await a0
+        return value
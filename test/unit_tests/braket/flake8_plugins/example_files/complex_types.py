@@ -19,4 +19,5 @@ def my_func(a0: int, a1: Tuple[int, ...], a2: Optional[Union[MyA, MyB]] = None,
     Returns:
         List[List[int]]: This is a complex return
     """
-    pass
+    result = [[a0]]
+    return result
@@ -0,0 +1,9 @@
+def function_0(a0: int) -> int:
+    """Function whose first invalid indent is an argument continuation line.
+    Args:
+        a0 (int): The value, with a description that
+          continues on a badly indented line.
+    Returns:
+      int: The result.
+    """
+    return a0
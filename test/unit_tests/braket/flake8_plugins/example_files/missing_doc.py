@@ -18,3 +18,9 @@ def my_function_2(a0: int, a1: str | None = None, a2: str = None, a3: str | None
         int: value of the function
     """
     pass
+
+
+def my_function_3(a0: float) -> float:
+    val = a0 + 0.1
+    """This string is not the function docstring."""
+    return val
@@ -183,6 +183,20 @@ def function_17(*, a0: int) -> int:
     pass
 
 
+def function_18(a0: int) -> int:
+    pass
+
+
+def function_19(a0: int) -> int:
+    """
+    Args:
+        a0 (int): This is a parameter
+    Returns:
+        int: value of the function
+    """
+    pass
+
+
 class MyClass:
     def __init__(self, a0:int):
         """
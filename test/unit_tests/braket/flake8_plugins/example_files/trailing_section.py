@@ -0,0 +1,7 @@
+def function_0(a0: int) -> int:
+    """Function with a return section header on its last line.
+    Args:
+        a0 (int): The value.
+    Returns:
+"""
+    return a0
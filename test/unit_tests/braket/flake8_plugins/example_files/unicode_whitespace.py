@@ -0,0 +1,16 @@
+from typing import Dict
+
+
+def function_0(a0: Dict[str, int]) -> None:
+    """Function with a non-breaking space in a documented argument type.
+    Args:
+        a0 (Dict[str, int]): The value.
+    """
+
+
+def function_1() -> Dict[str, int]:
+    """Function with a non-breaking space in its documented return type.
+    Returns:
+        Dict[str, int]: The result.
+    """
+    return {}
@@ -1,144 +1,271 @@
 import ast
-from typing import Set
+import os
+from typing import FrozenSet
 
 import pytest
-from utils_for_testing import read_file
+from utils_for_testing import LOCAL_DIR, read_file
 
 from braket.flake8_plugins.braket_checkstyle_plugin import BraketCheckstylePlugin
 
 FILE_PATH = "example_files"
 
+# Parsed once at import so the tests only time the plugin itself.
+EXAMPLE_TREES = {
+    filename: ast.parse(read_file(f"{FILE_PATH}/{filename}"))
+    for filename in os.listdir(os.path.join(LOCAL_DIR, FILE_PATH))
+    if filename.endswith(".py")
+}
 
-def _results(text: str) -> Set[str]:
-    tree = ast.parse(text)
+_ERR_SIMPLE_FUNCTIONS = frozenset(
+    {
+        "4:0 BCS004 - Argument 'my_param' documentation is missing the type hint.",
+        "4:0 BCS005 - Argument 'my_param_4' type hint doesn't match documentation. expected: 'int', documented as: 'bool'.",  # noqa
+        "4:0 BCS006 - Function 'test' doesn't specify a return type in the documentation. expected: 'int'.",  # noqa
+        "4:19 BCS001 - Argument 'my_param_2' is missing a type hint.",
+        "4:9 BCS001 - Argument 'my_param' is missing a type hint.",
+    }
+)
+
+_ERR_MISSING_RETURN_TYPE = frozenset(
+    {"1:0 BCS002 - Function 'my_function' is missing a type hint for the return value."}
+)
+
+_ERR_MISSING_DOC = frozenset(
+    {
+        "4:0 BCS003 - Function 'my_function' is missing documentation.",
+        "9:0 BCS023 - Argument 'a2' defaults to None but type hint doesn't end with '| None'.",  # noqa
+        "23:0 BCS003 - Function 'my_function_3' is missing documentation.",
+    }
+)
+
+_ERR_CLASS_FUNCTIONS = frozenset(
+    {
+        "5:19 BCS001 - Argument 'my_param' is missing a type hint.",
+        "5:4 BCS004 - Argument 'my_param' documentation is missing the type hint.",
+        "5:4 BCS005 - Argument 'my_param_3' type hint doesn't match documentation. expected: 'int', documented as: 'bool'.",  # noqa
+        "5:4 BCS007 - Unknown documented argument 'my_param_4'.",
+        "5:4 BCS008 - Argument 'my_param_3' is missing a description.",
+        "5:4 BCS009 - Argument 'my_param_2' is specified more than once.",
+        "5:4 BCS010 - Function 'test' return type hint doesn't match documentation. expected: 'int', documented as: 'List'.",  # noqa
+        "5:4 BCS011 - Argument 'my_param5' is missing type hint documentation.",
+    }
+)
+
+_ERR_UNHANDLED_TYPES = frozenset(
+    {
+        "4:0 BCS005 - Argument 'a0' type hint doesn't match documentation. expected: '', documented as: 'NewType'."  # noqa
+    }
+)
+
+_ERR_COMPLEX_TYPES = frozenset(
+    {
+        "12:0 BCS005 - Argument 'a2' type hint doesn't match documentation. expected: 'Optional[Union[MyA,MyB]]', documented as: 'Optional[List[MyA,MyB]]'.",  # noqa
+        "12:0 BCS017 - Function 'my_func' is missing function description documentation.",
+    }
+)
+
+_ERR_DOC_DUPLICATE_SECTIONS = frozenset(
+    {
+        "1:0 BCS012 - Function 'function_0' argument and return documentation has duplicate argument definitions.",  # noqa
+        "1:0 BCS014 - Function 'function_0' argument and return documentation has duplicate return definitions.",  # noqa
+        "1:0 BCS022 - Found '3' invalid indents starting with line ('Args').",
+    }
+)
+
+_ERR_DOC_WRONG_ORDER = frozenset(
+    {"1:0 BCS013 - Function 'function_0' has documented sections in the wrong order"}
+)
+
+_ERR_MORE_TYPES = frozenset(
+    {
+        "12:0 BCS006 - Function 'my_func' doesn't specify a return type in the documentation. expected: 'ndarray'.",  # noqa
+        "12:0 BCS011 - Argument 'a0' is missing type hint documentation.",
+        "12:0 BCS015 - Argument 'a1' is out of order.",
+        "12:0 BCS015 - Argument 'a2' is out of order.",
+        "12:0 BCS022 - Found '1' invalid indents starting with line ('This is not ind...').",  # noqa
+    }
+)
+
+_ERR_MISSING_DESCRIPTION = frozenset(
+    {"1:0 BCS016 - Return doc for function 'function_0' is missing the description."}
+)
+
+_ERR_MISSING_DOC_PARTS = frozenset(
+    {
+        "1:0 BCS018 - Function 'function_0' is missing argument documentation.",
+        "1:0 BCS021 - Function 'function_0' is missing return documentation.",
+    }
+)
+
+_ERR_REDUNDANT_DOC_PARTS = frozenset(
+    {
+        "1:0 BCS007 - Unknown documented argument 'my_param'.",
+        "1:0 BCS019 - Function 'function_0' has argument documentation but no arguments.",
+    }
+)
+
+_ERR_NO_RETURN_TYPE = frozenset(
+    {"1:0 BCS020 - Function '__my_function__' has return documentation but no return type."}  # noqa
+)
+
+_ERR_LINE_FORMATTING = frozenset(
+    {"4:0 BCS022 - Found '3' invalid indents starting with line ('a1')."}
+)
+
+_ERR_KEYWORD_FUNCTIONS = frozenset(
+    {
+        "13:29 BCS001 - Argument 'arg1' is missing a type hint.",
+        "1:0 BCS004 - Argument 'arg3' documentation is missing the type hint.",
+        "1:0 BCS005 - Argument 'arg2' type hint doesn't match documentation. expected: 'int', documented as: 'bool'.",  # noqa
+        "1:0 BCS011 - Argument 'arg1' is missing type hint documentation.",
+        "1:0 BCS015 - Argument 'arg2' is out of order.",
+        "26:0 BCS023 - Argument 'a2' defaults to None but type hint doesn't end with '| None'.",  # noqa
+    }
+)
+
+_ERR_ASYNC_FUNCTIONS = frozenset(
+    {
+        "1:0 BCS005 - Argument 'a1' type hint doesn't match documentation. expected: 'int', documented as: 'str'.",  # noqa
+        "1:21 BCS001 - Argument 'a0' is missing a type hint.",
+        "14:4 BCS002 - Function 'function_1' is missing a type hint for the return value.",
+    }
+)
+
+_ERR_TRAILING_SECTION = frozenset(
+    {
+        "1:0 BCS006 - Function 'function_0' doesn't specify a return type in the documentation. expected: 'int'.",  # noqa
+        "1:0 BCS016 - Return doc for function 'function_0' is missing the description.",
+        "1:0 BCS022 - Found '1' invalid indents starting with line ('').",
+    }
+)
+
+_ERR_UNICODE_WHITESPACE = frozenset()
+
+_ERR_CONTINUATION_INDENT = frozenset(
+    {"1:0 BCS022 - Found '2' invalid indents starting with line ('continues on a ...')."}
+)
+
+
+def _results(tree: ast.AST) -> FrozenSet[str]:
     plugin = BraketCheckstylePlugin(tree)
-    return {f"{line}:{col} {msg}" for line, col, msg, _ in plugin.run()}
+    return frozenset(f"{line}:{col} {msg}" for line, col, msg, _ in plugin.run())
+
+
+@pytest.fixture
+def results(request) -> FrozenSet[str]:
+    return _results(EXAMPLE_TREES[request.param])
 
 
 def test_no_error_functions() -> None:
     """Test various functions which should not cause any errors."""
-    file = read_file(f"{FILE_PATH}/no_error_functions.py")
-    assert _results(file) == set()
+    assert _results(EXAMPLE_TREES["no_error_functions.py"]) == frozenset()
 
 
 @pytest.mark.parametrize(
-    "filename, error_set",
+    "results, error_set",
     [
-        (
+        pytest.param(
             "simple_functions.py",
-            {
-                "4:0 BCS004 - Argument 'my_param' documentation is missing the type hint.",
-                "4:0 BCS005 - Argument 'my_param_4' type hint doesn't match documentation. expected: 'int', documented as: 'bool'.",  # noqa
-                "4:0 BCS006 - Function 'test' doesn't specify a return type in the documentation. expected: 'int'.",  # noqa
-                "4:19 BCS001 - Argument 'my_param_2' is missing a type hint.",
-                "4:9 BCS001 - Argument 'my_param' is missing a type hint.",
-            },
-        ),
-        (
+            _ERR_SIMPLE_FUNCTIONS,
+            id="simple_functions.py",
+        ),
+        pytest.param(
             "missing_return_type.py",
-            {"1:0 BCS002 - Function 'my_function' is missing a type hint for the return value."},
+            _ERR_MISSING_RETURN_TYPE,
+            id="missing_return_type.py",
         ),
-        (
+        pytest.param(
             "missing_doc.py",
-            {
-                "4:0 BCS003 - Function 'my_function' is missing documentation.",
-                "9:0 BCS023 - Argument 'a2' defaults to None but type hint doesn't end with '| None'.",  # noqa
-            },
+            _ERR_MISSING_DOC,
+            id="missing_doc.py",
         ),
-        (
+        pytest.param(
             "class_functions.py",
-            {
-                "5:19 BCS001 - Argument 'my_param' is missing a type hint.",
-                "5:4 BCS004 - Argument 'my_param' documentation is missing the type hint.",
-                "5:4 BCS005 - Argument 'my_param_3' type hint doesn't match documentation. expected: 'int', documented as: 'bool'.",  # noqa
-                "5:4 BCS007 - Unknown documented argument 'my_param_4'.",
-                "5:4 BCS008 - Argument 'my_param_3' is missing a description.",
-                "5:4 BCS009 - Argument 'my_param_2' is specified more than once.",
-                "5:4 BCS010 - Function 'test' return type hint doesn't match documentation. expected: 'int', documented as: 'List'.",  # noqa
-                "5:4 BCS011 - Argument 'my_param5' is missing type hint documentation.",
-            },
-        ),
-        (
+            _ERR_CLASS_FUNCTIONS,
+            id="class_functions.py",
+        ),
+        pytest.param(
             "unhandled_types.py",
-            {
-                "4:0 BCS005 - Argument 'a0' type hint doesn't match documentation. expected: '', documented as: 'NewType'."  # noqa
-            },  # noqa
+            _ERR_UNHANDLED_TYPES,
+            id="unhandled_types.py",
         ),
-        (
+        pytest.param(
             "complex_types.py",
-            {
-                "12:0 BCS005 - Argument 'a2' type hint doesn't match documentation. expected: 'Optional[Union[MyA,MyB]]', documented as: 'Optional[List[MyA,MyB]]'.",  # noqa
-                "12:0 BCS017 - Function 'my_func' is missing function description documentation.",
-            },
+            _ERR_COMPLEX_TYPES,
+            id="complex_types.py",
         ),
-        (
+        pytest.param(
             "doc_duplicate_sections.py",
-            {
-                "1:0 BCS012 - Function 'function_0' argument and return documentation has duplicate argument definitions.",  # noqa
-                "1:0 BCS014 - Function 'function_0' argument and return documentation has duplicate return definitions.",  # noqa
-                "1:0 BCS022 - Found '3' invalid indents starting with line ('Args').",
-            },
+            _ERR_DOC_DUPLICATE_SECTIONS,
+            id="doc_duplicate_sections.py",
         ),
-        (
+        pytest.param(
             "doc_wrong_order.py",
-            {"1:0 BCS013 - Function 'function_0' has documented sections in the wrong order"},
+            _ERR_DOC_WRONG_ORDER,
+            id="doc_wrong_order.py",
         ),
-        (
+        pytest.param(
             "more_types.py",
-            {
-                "12:0 BCS006 - Function 'my_func' doesn't specify a return type in the documentation. expected: 'ndarray'.",  # noqa
-                "12:0 BCS011 - Argument 'a0' is missing type hint documentation.",
-                "12:0 BCS015 - Argument 'a1' is out of order.",
-                "12:0 BCS015 - Argument 'a2' is out of order.",
-                "12:0 BCS022 - Found '1' invalid indents starting with line ('This is not ind...').",  # noqa
-            },
-        ),
-        (
+            _ERR_MORE_TYPES,
+            id="more_types.py",
+        ),
+        pytest.param(
             "missing_description.py",
-            {"1:0 BCS016 - Return doc for function 'function_0' is missing the description."},
+            _ERR_MISSING_DESCRIPTION,
+            id="missing_description.py",
         ),
-        (
+        pytest.param(
             "missing_doc_parts.py",
-            {
-                "1:0 BCS018 - Function 'function_0' is missing argument documentation.",
-                "1:0 BCS021 - Function 'function_0' is missing return documentation.",
-            },
+            _ERR_MISSING_DOC_PARTS,
+            id="missing_doc_parts.py",
         ),
-        (
+        pytest.param(
             "redundant_doc_parts.py",
-            {
-                "1:0 BCS007 - Unknown documented argument 'my_param'.",
-                "1:0 BCS019 - Function 'function_0' has argument documentation but no arguments.",
-            },
+            _ERR_REDUNDANT_DOC_PARTS,
+            id="redundant_doc_parts.py",
         ),
-        (
+        pytest.param(
             "no_return_type.py",
-            {
-                "1:0 BCS020 - Function '__my_function__' has return documentation but no return type."  # noqa
-            },
+            _ERR_NO_RETURN_TYPE,
+            id="no_return_type.py",
         ),
-        (
+        pytest.param(
             "line_formatting.py",
-            {"4:0 BCS022 - Found '3' invalid indents starting with line ('a1')."},
+            _ERR_LINE_FORMATTING,
+            id="line_formatting.py",
         ),
-        (
+        pytest.param(
             "keyword_functions.py",
-            {
-                "13:29 BCS001 - Argument 'arg1' is missing a type hint.",
-                "1:0 BCS004 - Argument 'arg3' documentation is missing the type hint.",
-                "1:0 BCS005 - Argument 'arg2' type hint doesn't match documentation. expected: 'int', documented as: 'bool'.",  # noqa
-                "1:0 BCS011 - Argument 'arg1' is missing type hint documentation.",
-                "1:0 BCS015 - Argument 'arg2' is out of order.",
-                "26:0 BCS023 - Argument 'a2' defaults to None but type hint doesn't end with '| None'.",  # noqa
-            },
+            _ERR_KEYWORD_FUNCTIONS,
+            id="keyword_functions.py",
+        ),
+        pytest.param(
+            "async_functions.py",
+            _ERR_ASYNC_FUNCTIONS,
+            id="async_functions.py",
+        ),
+        pytest.param(
+            "trailing_section.py",
+            _ERR_TRAILING_SECTION,
+            id="trailing_section.py",
+        ),
+        pytest.param(
+            "unicode_whitespace.py",
+            _ERR_UNICODE_WHITESPACE,
+            id="unicode_whitespace.py",
+        ),
+        pytest.param(
+            "continuation_indent.py",
+            _ERR_CONTINUATION_INDENT,
+            id="continuation_indent.py",
         ),
     ],
+    indirect=["results"],
 )
-def test_functions(filename: str, error_set: Set[str]) -> None:
+def test_functions(results: FrozenSet[str], error_set: FrozenSet[str]) -> None:
     """Test various files and validate the expected error set.
     Args:
-        filename (str): The file name containing the functions to test.
-        error_set (Set[str]): The expected errors.
+        results (FrozenSet[str]): The errors found in the file named by the test case.
+        error_set (FrozenSet[str]): The expected errors.
     """
-    file = read_file(f"{FILE_PATH}/{filename}")
-    assert _results(file) == error_set
+    assert results == error_set
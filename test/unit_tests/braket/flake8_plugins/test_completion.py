@@ -1,9 +1,13 @@
 import ast
-from unittest.mock import Mock
+import sys
 
 import pytest
 
 from braket.flake8_plugins.braket_checkstyle_plugin import (
+    ArgType,
+    _get_argument_indices,
+    _parse_arg_info,
+    _parse_return_info,
     _return_type_requires_documentation,
     _Visitor,
 )
@@ -11,51 +15,95 @@ from braket.flake8_plugins.braket_checkstyle_plugin import (
 
 def test_check_annotation_invalid_annotation_type():
     visitor = _Visitor()
-    visitor._check_annotation("test", "test", 0, None, Mock())
+    node = ast.parse("def f(test): pass").body[0]
+    visitor._check_annotation("test", "test", 0, None, node)
     assert visitor.problems == []
 
 
+@pytest.mark.skipif(sys.version_info >= (3, 9), reason="ast.Index is only produced before 3.9")
 def test_annotation_to_doc_str_subscript_annotation_index():
-    annotation = Mock(spec=ast.Subscript)
-    annotation.value = Mock(spec=ast.Name)
-    annotation.value.id = "Annotation ID"
-    annotation.slice = Mock(spec=ast.Index)
-    annotation.slice.value = Mock(spec=ast.Name)
-    annotation.slice.value.id = "Slice ID"
+    annotation = ast.parse("Annotation[Slice]", mode="eval").body
+    assert isinstance(annotation.slice, ast.Index)
     visitor = _Visitor()
     result = visitor._annotation_to_doc_str(annotation)
-    assert result == "Annotation ID[Slice ID]"
+    assert result == "Annotation[Slice]"
 
 
 def test_annotation_to_doc_str_subscript_backward_compatibility():
-    annotation = Mock(spec=ast.Subscript)
-    annotation.value = Mock(spec=ast.Name)
-    annotation.value.id = "Annotation ID"
-    annotation.slice = Mock(spec=ast.Name)
-    annotation.slice.id = "Slice ID"
+    annotation = ast.Subscript(value=ast.Name(id="Annotation ID"), slice=ast.Name(id="Slice ID"))
     visitor = _Visitor()
     result = visitor._annotation_to_doc_str(annotation)
     assert result == "Annotation ID[Slice ID]"
 
 
 def test_annotation_to_doc_str_subscript_unhandled():
-    annotation = Mock(spec=ast.Subscript)
-    annotation.value = Mock(spec=ast.Attribute)
+    annotation = ast.parse("module.Type[int]", mode="eval").body
     visitor = _Visitor()
     with pytest.raises(NotImplementedError):
         visitor._annotation_to_doc_str(annotation)
 
 
 def test_annotation_to_doc_str_binop_unhandled():
-    annotation = Mock(spec=ast.BinOp)
-    annotation.op = Mock(spec=ast.BitXor)
+    annotation = ast.parse("int ^ str", mode="eval").body
     visitor = _Visitor()
     with pytest.raises(NotImplementedError):
         visitor._annotation_to_doc_str(annotation)
 
 
+def test_annotation_to_doc_str_string_constant():
+    annotation = ast.parse('"MyType"', mode="eval").body
+    visitor = _Visitor()
+    assert visitor._annotation_to_doc_str(annotation) == ""
+
+
 def test_return_type_requires_documentation():
-    return_type = Mock()
-    return_type.returns = None
-    result = _return_type_requires_documentation(return_type)
+    node = ast.parse("def f(): pass").body[0]
+    result = _return_type_requires_documentation(node)
     assert not result
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("    a0 (int): A parameter.", ("    ", "a0", "(int)", "A parameter.")),
+        ("    a0: A parameter.", ("    ", "a0", None, "A parameter.")),
+        ("    `*a1` (list): Values.", ("    ", "*a1", "(list)", "Values.")),
+        ("    ``**kwargs``:", ("    ", "**kwargs", None, "")),
+        ("    a0 (Dict[str, int]) :  Spaced.", ("    ", "a0", "(Dict[str, int])", "Spaced.")),
+        ("    a0 (int) extra: Not an argument.", None),
+        ("    ***a0: Not an argument.", None),
+        ("    ````: d", ("    ", "", None, "d")),
+        ("    ```a0: d", None),
+        ("    `````: d", None),
+        ("    ```: d", ("    ", "", None, "d")),
+        ("    ``` (int): d", ("    ", "", "(int)", "d")),
+        ("    ````a0``: d", None),
+        ("    `a0``: d", ("    ", "a0", None, "d")),
+        ("    ``*a0`: d", ("    ", "*a0", None, "d")),
+        ("    continuation line without colon", None),
+        ("    a0 (" + "(x) " * 5000 + "x: desc", None),
+    ],
+)
+def test_parse_arg_info(line, expected):
+    assert _parse_arg_info(line) == expected
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("    int: The result.", ("    ", "int", ":", "The result.")),
+        ("    The result.", ("    ", "The result.", None, "")),
+        ("", ("", "", None, "")),
+    ],
+)
+def test_parse_return_info(line, expected):
+    assert _parse_return_info(line) == expected
+
+
+def test_get_argument_indices():
+    node = ast.parse("def f(self, a0, *args, a1, **kwargs): pass").body[0]
+    assert _get_argument_indices(node) == {
+        "self": (0, ArgType.DEFAULT),
+        "a0": (1, ArgType.DEFAULT),
+        "a1": (0, ArgType.KEYWORD),
+    }
@@ -1,5 +1,7 @@
 import os
 
+LOCAL_DIR = os.path.dirname(__file__)
+
 
 def read_file(path: str) -> str:
     """Reads a file from a path and returns the contents as a string
@@ -8,7 +10,6 @@ def read_file(path: str) -> str:
     Returns:
         str: The contents of the file.
     """
-    local_dir = os.path.dirname(__file__)
-    source_file = os.path.join(local_dir, path)
+    source_file = os.path.join(LOCAL_DIR, path)
     with open(source_file) as file:
         return file.read()